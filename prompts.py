@@ -0,0 +1,43 @@
+"""Prompt frameworks, shared default field values and prompt rendering.
+
+Imported by app.py so these tables are built once per process rather than
+on every Streamlit rerun of the script.
+"""
+from __future__ import annotations
+
+from types import MappingProxyType
+
+# ---------------------------
+# Framework templates
+# ---------------------------
+FRAMEWORKS: dict[str, tuple[str, ...]] = {
+    "CO-STAR": ("Context", "Objective", "Style", "Tone", "Audience", "Response"),
+    "CRISPE": ("Capacity/Constraints", "Role", "Insight/Context", "Steps", "Persona", "Evaluation"),
+    "CLEAR": ("Context", "Language", "Examples", "Analysis/Thinking Style", "Restrictions"),
+    "Basic (Context-Objective-Constraints-Examples-Output)": ("Context", "Objective", "Constraints", "Examples", "Output Format")
+}
+FRAMEWORK_NAMES: tuple[str, ...] = tuple(FRAMEWORKS)
+
+DEFAULTS = MappingProxyType({
+    "Style": "Professional, concise, structured",
+    "Tone": "Neutral, informative",
+    "Audience": "General professional reader",
+    "Response": "Provide structured, clear, and actionable answers",
+    "Role": "Expert AI assistant",
+    "Steps": "Explain step-by-step only when necessary; summarize reasoning (no chain-of-thought).",
+    "Evaluation": "Check completeness, clarity, constraint compliance, and coherence before finalizing.",
+    "Language": "English",
+    "Analysis/Thinking Style": "Structured, evidence-based; brief rationale only.",
+})
+
+# ---------------------------
+# Prompt generation
+# ---------------------------
+def generate_prompt(framework: str, inputs: dict[str, str]) -> str:
+    parts = []
+    for field in FRAMEWORKS[framework]:
+        val = (inputs.get(field) or "").strip()
+        if not val:
+            val = "Not specified"
+        parts.append(f"**{field}:** {val}")
+    return "\n\n".join(parts)
@@ -0,0 +1,153 @@
+"""Prompt quality rubric: heuristic checks, 0-10 score and suggestions.
+
+Kept free of Streamlit imports and fully annotated so it can be unit
+tested on its own or compiled ahead of time (e.g. with mypyc).
+"""
+from __future__ import annotations
+
+import functools
+import re
+from typing import Any
+
+# ---------------------------
+# Scoring & Rubric
+# ---------------------------
+RUBRIC_WEIGHTS = {
+    # Coverage
+    "objective_present": 1.5,
+    "context_present": 1.0,
+    "constraints_present": 1.0,
+    "examples_present": 0.8,
+    "output_format_present": 0.7,
+    # Quality heuristics
+    "objective_quality": 1.2,   # length / specificity
+    "constraints_quality": 1.0, # includes style/limits/guardrails
+    "examples_quality": 0.8,    # has Input/Output pattern or few-shot cues
+    "format_quality": 0.8,      # JSON keys / sectioning cues
+    "ambiguity_low": 1.0,       # few vague words, fewer TBDs
+}
+_MAX_RUBRIC_SCORE = sum(RUBRIC_WEIGHTS.values())
+_INV_MAX_RUBRIC_SCORE = 10.0 / _MAX_RUBRIC_SCORE
+
+# Checks are computed as a tuple in RUBRIC_WEIGHTS order and indexed by position
+_CHECK_NAMES = tuple(RUBRIC_WEIGHTS)
+_CHECK_WEIGHTS = tuple(RUBRIC_WEIGHTS.values())
+(_OBJECTIVE_PRESENT, _CONTEXT_PRESENT, _CONSTRAINTS_PRESENT, _EXAMPLES_PRESENT, _OUTPUT_FORMAT_PRESENT,
+ _OBJECTIVE_QUALITY, _CONSTRAINTS_QUALITY, _EXAMPLES_QUALITY, _FORMAT_QUALITY, _AMBIGUITY_LOW) = range(len(_CHECK_NAMES))
+
+# (presence check, quality check, suggestion if missing, suggestion if weak);
+# a rule without a quality check never emits its weak suggestion
+_SUGGESTION_RULES: tuple[tuple[int, int | None, str, str], ...] = (
+    (_OBJECTIVE_PRESENT, _OBJECTIVE_QUALITY,
+     "Add a clear objective starting with a strong verb (e.g., *Analyze*, *Summarize*, *Design*).",
+     "Make the objective more specific (scope, data, success criteria)."),
+    (_CONTEXT_PRESENT, None,
+     "Provide domain, audience, and key background constraints in **Context**.",
+     ""),
+    (_CONSTRAINTS_PRESENT, _CONSTRAINTS_QUALITY,
+     "Add **Constraints** (tone, word/section limits, must/avoid, compliance/guardrails).",
+     "Tighten **Constraints**: include style (e.g., *professional*), limits (e.g., *≤200 words*), and guardrails (*no chain-of-thought*, *cite sources*)."),
+    (_EXAMPLES_PRESENT, _EXAMPLES_QUALITY,
+     "Add 1–2 **few-shot Examples** (clear *Input → Output* pairs).",
+     "Improve examples: label **Input:** and **Output:** and show the ideal structure."),
+    (_OUTPUT_FORMAT_PRESENT, _FORMAT_QUALITY,
+     "Specify an **Output Format** (e.g., bullet points or JSON with required keys).",
+     "Refine format: define JSON keys or markdown sections (Executive Summary, Findings, Recommendations)."),
+)
+
+# Keyword groups used by the quality heuristics
+ACTION_VERBS = ["analyze", "summarize", "compare", "design", "draft", "generate", "evaluate", "classify", "extract"]
+GUARDRAIL_TERMS = ["cite", "do not", "avoid", "limit", "word", "tone", "comply", "policy", "no chain-of-thought", "refuse"]
+EXAMPLE_MARKERS = ["input:", "output:", "example", "shot", "context → response", "instruction:", "response:"]
+JSON_MARKERS = ["{", "}", "json", "keys", "schema"]
+SECTION_MARKERS = ["bullet", "markdown", "sections", "executive summary", "findings", "recommendations"]
+VAGUE_TERMS = ["tbd", "etc.", "and so on", "something like", "roughly", "maybe", "as needed"]
+
+def _keyword_re(keywords: list[str]) -> re.Pattern[str]:
+    # Case-sensitive on purpose: callers search str.lower() text, which keeps the
+    # rubric's lower()+substring semantics (IGNORECASE would also fold e.g. "ſ", "İ", "K")
+    return re.compile("|".join(re.escape(k.lower()) for k in keywords))
+
+# Compiled once at import; scoring runs on every submit
+_TOKEN_RE = re.compile(r"\w+|\S")
+_ACTION_RE = _keyword_re(ACTION_VERBS)
+_GUARDRAIL_RE = _keyword_re(GUARDRAIL_TERMS)
+_EXAMPLE_RE = _keyword_re(EXAMPLE_MARKERS)
+_FORMAT_RE = _keyword_re(JSON_MARKERS + SECTION_MARKERS)
+_VAGUE_RE = _keyword_re(VAGUE_TERMS)
+
+# ASCII tables reproducing _TOKEN_RE counts without building a match list:
+# _PUNCT_DELETE keeps only punctuation (one token each), _PUNCT_TO_SPACE
+# splits word runs apart so str.split() counts them. Below ~100 chars the two
+# translate passes cost more than findall, so short fields keep the regex.
+_TRANSLATE_MIN_LEN = 100
+_ASCII = [chr(i) for i in range(128)]
+_ASCII_PUNCT = [c for c in _ASCII if not c.isspace() and not re.match(r"\w", c)]
+_PUNCT_DELETE = str.maketrans({c: None for c in _ASCII if c not in _ASCII_PUNCT})
+_PUNCT_TO_SPACE = str.maketrans({c: " " for c in _ASCII_PUNCT})
+
+def _len_tokens(text: str) -> int:
+    # very rough token proxy (whitespace + punctuation split)
+    if not text: return 0
+    if len(text) >= _TRANSLATE_MIN_LEN and text.isascii():
+        return len(text.translate(_PUNCT_DELETE)) + len(text.translate(_PUNCT_TO_SPACE).split())
+    return len(_TOKEN_RE.findall(text))
+
+@functools.lru_cache(maxsize=256)
+def _score_core(ctx: str, obj: str, cons: str, ex: str, fmt: str) -> tuple[float, tuple[bool, ...], tuple[str, ...]]:
+    """Score the five rubric fields; returns hashable (score, checks, suggestions)."""
+    obj_lower = obj.lower()
+
+    # Quality checks (heuristics)
+    # Objective quality: length and presence of action verbs
+    # (every token spans at least one character, so len() bounds the token count)
+    objective_quality = len(obj) >= 8 and _ACTION_RE.search(obj_lower) is not None and _len_tokens(obj) >= 8
+
+    # Constraints quality: style/length/guardrails detectable
+    constraints_quality = _GUARDRAIL_RE.search(cons.lower()) is not None or (len(cons) >= 6 and _len_tokens(cons) >= 6)
+
+    # Examples quality: few-shot structure indicators
+    examples_quality = _EXAMPLE_RE.search(ex.lower()) is not None or (ex.count(":") >= 2 and len(ex) >= 12 and _len_tokens(ex) >= 12)
+
+    # Output format quality: json keys or headings
+    format_quality = _FORMAT_RE.search(fmt.lower()) is not None
+
+    # Ambiguity penalty (we invert it to a positive check)
+    high_ambiguity = _VAGUE_RE.search(obj_lower) is not None or _VAGUE_RE.search(ctx.lower()) is not None
+
+    checks = (
+        # Coverage
+        bool(obj), bool(ctx), bool(cons), bool(ex), bool(fmt),
+        # Quality
+        objective_quality, constraints_quality, examples_quality, format_quality, not high_ambiguity,
+    )
+
+    # Score aggregation
+    raw = sum(w for w, v in zip(_CHECK_WEIGHTS, checks) if v)
+    score_10 = round(raw * _INV_MAX_RUBRIC_SCORE, 1)
+
+    # Suggestions
+    suggestions = [
+        missing if not checks[present] else weak
+        for present, quality, missing, weak in _SUGGESTION_RULES
+        if not checks[present] or (quality is not None and not checks[quality])
+    ]
+    if not checks[_AMBIGUITY_LOW]:
+        suggestions.append("Remove vague phrases (e.g., *TBD, etc.*) and state exact scope/assumptions.")
+
+    return score_10, checks, tuple(suggestions)
+
+def score_inputs(inputs: dict[str, str]) -> dict[str, Any]:
+    """Return detailed scoring and suggestions."""
+    ctx = (inputs.get("Context") or inputs.get("Insight/Context") or "").strip()
+    obj = (inputs.get("Objective") or "").strip()
+    cons = (inputs.get("Constraints") or inputs.get("Capacity/Constraints") or inputs.get("Restrictions") or "").strip()
+    ex  = (inputs.get("Examples") or "").strip()
+    fmt = (inputs.get("Output Format") or "").strip()
+
+    score_10, checks, suggestions = _score_core(ctx, obj, cons, ex, fmt)
+    return {
+        "score_out_of_10": score_10,
+        "checks": dict(zip(_CHECK_NAMES, checks)),
+        "suggestions": list(suggestions)
+    }